@@ -1,19 +1,31 @@
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
-from typing import Optional, Literal
+import math
+import operator
+import os
+import secrets
+
+import msgspec
+import orjson
+from fastapi import FastAPI, Header, HTTPException, Request, Response
+from pydantic import BaseModel, Field
+from typing import List, Optional, Literal
+
+import numpy as np
 
 from kalkulacka import (
-    InvestmentType,
+    InputError,
     LumpSumInput,
     RentaInput,
+    clear_caches,
     compute_lump_sum,
+    compute_lump_sum_sweep,
+    compute_lump_sum_vec,
     compute_renta,
 )
 
 app = FastAPI()
 
 
-class CalcRequest(BaseModel):
+class CalcRequest(msgspec.Struct):
     # Varianta: studia/bydlení/... = "lump_sum", důchod = "renta"
     goal_type: Literal["lump_sum", "renta"]
 
@@ -36,35 +48,125 @@ class CalcRequest(BaseModel):
     # annual_rate_accum se používá i u renty (akumulace) -> je už nahoře
 
 
+# /calc čte tělo ručně, schéma pro OpenAPI proto generuje msgspec
+_CALC_REQUEST_SCHEMA = msgspec.json.schema_components([CalcRequest])[1]["CalcRequest"]
+
+
+class CalcBatchRequest(BaseModel):
+    # Dávka scénářů pro jednorázový cíl – všechna pole musí mít stejnou délku
+    investment_type: List[Literal["one_time", "monthly", "combined"]]
+    target_amount: List[float]
+    years: List[float]
+    annual_rate_accum: List[float]
+
+    # Volitelné – jednorázové investice pro "combined" (jinak nuly)
+    one_time_investment: Optional[List[float]] = None
+
+
+class SweepRequest(BaseModel):
+    # Základní vstup pro jednorázový cíl
+    investment_type: Literal["one_time", "monthly", "combined"]
+    target_amount: float
+    years: float
+    annual_rate_accum: float
+    one_time_investment: float = 0.0
+
+    # Který parametr se prochází a v jakém rozsahu (start včetně, stop bez);
+    # NaN/inf (i jako řetězce "nan"/"inf") odmítne validace s 422
+    param: Literal["target_amount", "years", "annual_rate_accum", "one_time_investment"] = "annual_rate_accum"
+    start: float = Field(allow_inf_nan=False)
+    stop: float = Field(allow_inf_nan=False)
+    step: float = Field(allow_inf_nan=False)
+
+
+# Horní mez počtu bodů jednoho sweepu
+MAX_SWEEP_POINTS = 100_000
+
+
+_HEALTH_BODY = b'{"ok":true}'
+
+
 @app.get("/health")
 def health():
-    return {"ok": True}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
+
+
+# Povinná pole pro jednotlivé cíle – attrgetter vrátí tuple hodnot jedním voláním
+_LUMP_FIELDS = ("target_amount", "years", "annual_rate_accum")
+_RENTA_FIELDS = ("monthly_rent", "years_rent", "annual_rate_rent", "years_saving", "annual_rate_accum")
+_LUMP_REQUIRED = operator.attrgetter(*_LUMP_FIELDS)
+_RENTA_REQUIRED = operator.attrgetter(*_RENTA_FIELDS)
+
+
+def _missing(fields, values):
+    return [k for k, v in zip(fields, values) if v is None]
+
+
+def _json_response(content, status_code: int = 200) -> Response:
+    # Předserializované bajty – FastAPI už výsledek nijak neprochází (jsonable_encoder apod.)
+    return Response(content=orjson.dumps(content), status_code=status_code, media_type="application/json")
+
+
+def _error(status_code: int, detail: str) -> Response:
+    return _json_response({"detail": detail}, status_code=status_code)
 
 
-@app.post("/calc")
-def calc(req: CalcRequest):
+@app.post("/admin/cache_clear")
+def cache_clear(x_admin_token: Optional[str] = Header(default=None)):
+    """
+    Vyprázdní memoizační cache výpočtů – jen s hlavičkou X-Admin-Token rovnou
+    proměnné prostředí ADMIN_TOKEN (bez ní je endpoint vypnutý).
+
+    Cache jsou per proces: při více workerech (WEB_CONCURRENCY) se vyprázdní jen
+    worker, který request obsloužil (pid v odpovědi). Pro všechny workery je
+    potřeba restart – např. SIGHUP rodičovskému procesu uvicornu.
+    """
+    admin_token = os.environ.get("ADMIN_TOKEN")
+    if not admin_token:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if x_admin_token is None or not secrets.compare_digest(x_admin_token, admin_token):
+        raise HTTPException(status_code=403, detail="Forbidden")
+    clear_caches()
+    return {"ok": True, "scope": "worker", "pid": os.getpid()}
+
+
+@app.post(
+    "/calc",
+    openapi_extra={
+        "requestBody": {"required": True, "content": {"application/json": {"schema": _CALC_REQUEST_SCHEMA}}},
+    },
+)
+async def calc(request: Request):
+    # Tělo requestu parsuje a validuje msgspec (v C) místo Pydanticu. strict=False
+    # zachová volnou konverzi čísel jako dřív (např. "1e6" -> 1000000.0); jen
+    # true/false už se na float nepřevádí a vrací 422. Projdou i "nan"/"inf" –
+    # ty odmítne validace vstupů v kalkulacka (InputError -> 400).
     try:
-        inv_type = InvestmentType(req.investment_type)
+        req = msgspec.json.decode(await request.body(), type=CalcRequest, strict=False)
+    except msgspec.ValidationError as e:
+        return _error(422, str(e))
+    except msgspec.DecodeError as e:
+        return _error(400, str(e))
 
+    try:
         if req.goal_type == "lump_sum":
-            missing = [k for k in ["target_amount", "years", "annual_rate_accum"] if getattr(req, k) is None]
-            if missing:
-                raise HTTPException(status_code=400, detail=f"Missing fields for lump_sum: {missing}")
+            values = _LUMP_REQUIRED(req)
+            if None in values:
+                return _error(400, f"Missing fields for lump_sum: {_missing(_LUMP_FIELDS, values)}")
 
             inp = LumpSumInput(
                 target_amount=req.target_amount,
                 years=req.years,
                 annual_rate_accum=req.annual_rate_accum,
-                investment_type=inv_type,
+                investment_type=req.investment_type,
                 one_time_investment=req.one_time_investment or 0.0,
             )
-            return compute_lump_sum(inp)
+            return _json_response(dict(compute_lump_sum(inp)))
 
         if req.goal_type == "renta":
-            missing = [k for k in ["monthly_rent", "years_rent", "annual_rate_rent", "years_saving", "annual_rate_accum"]
-                       if getattr(req, k) is None]
-            if missing:
-                raise HTTPException(status_code=400, detail=f"Missing fields for renta: {missing}")
+            values = _RENTA_REQUIRED(req)
+            if None in values:
+                return _error(400, f"Missing fields for renta: {_missing(_RENTA_FIELDS, values)}")
 
             inp = RentaInput(
                 monthly_rent=req.monthly_rent,
@@ -72,14 +174,105 @@ def calc(req: CalcRequest):
                 annual_rate_rent=req.annual_rate_rent,
                 years_saving=req.years_saving,
                 annual_rate_accum=req.annual_rate_accum,
-                investment_type=inv_type,
+                investment_type=req.investment_type,
                 one_time_investment=req.one_time_investment or 0.0,
             )
-            return compute_renta(inp)
+            return _json_response(dict(compute_renta(inp)))
+
+        return _error(400, "Unknown goal_type")
+
+    except InputError as e:
+        return _error(400, str(e))
+    except Exception as e:
+        return _error(500, str(e))
+
+
+@app.post("/calc_batch")
+def calc_batch(req: CalcBatchRequest):
+    size = len(req.investment_type)
+    one_time = req.one_time_investment if req.one_time_investment is not None else [0.0] * size
+    lengths = {len(req.target_amount), len(req.years), len(req.annual_rate_accum), len(one_time)}
+    if lengths != {size}:
+        raise HTTPException(status_code=400, detail="All batch fields must have the same length")
+
+    try:
+        result = compute_lump_sum_vec(
+            target=req.target_amount,
+            years=req.years,
+            rate=req.annual_rate_accum,
+            one_time=one_time,
+            inv_type=req.investment_type,
+        )
+    except InputError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
 
-        raise HTTPException(status_code=400, detail="Unknown goal_type")
+    payload = {"goal_type": "lump_sum", "investment_type": req.investment_type, **result}
+    return Response(
+        content=orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY),
+        media_type="application/json",
+    )
 
-    except HTTPException:
-        raise
+
+@app.post("/sweep")
+def sweep(req: SweepRequest):
+    if req.step <= 0:
+        raise HTTPException(status_code=400, detail="step must be positive")
+    # Počet bodů předem (round odfiltruje šum typu 70.00000000000001), body jako
+    # start + step * k – np.arange s float krokem chybu kumuluje. Body se dál
+    # nezaokrouhlují: u malého kroku by z různých bodů udělaly duplicity.
+    span = (req.stop - req.start) / req.step
+    # not <= chytí i přetečení do inf (např. start=-1e308, stop=1e308)
+    if not span <= MAX_SWEEP_POINTS:
+        raise HTTPException(status_code=400, detail=f"Too many sweep points (max {MAX_SWEEP_POINTS})")
+    count = max(0, math.ceil(round(span, 9)))
+    points = req.start + req.step * np.arange(count)
+
+    inp = LumpSumInput(
+        target_amount=req.target_amount,
+        years=req.years,
+        annual_rate_accum=req.annual_rate_accum,
+        investment_type=req.investment_type,
+        one_time_investment=req.one_time_investment,
+    )
+    try:
+        result = compute_lump_sum_sweep(inp, req.param, points)
+    except InputError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+    payload = {
+        "goal_type": "lump_sum",
+        "investment_type": req.investment_type,
+        "param": req.param,
+        "points": points,
+        **result,
+    }
+    return Response(
+        content=orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY),
+        media_type="application/json",
+    )
+
+
+if __name__ == "__main__":
+    # Produkční start: uvloop + httptools, worker na každé jádro (/calc je CPU-bound
+    # a bezstavový), bez access logu na hot path. Každý worker má vlastní cache
+    # (viz /admin/cache_clear).
+    #   ekvivalent: uvicorn app:app --loop uvloop --http httptools --workers $(nproc) --no-access-log
+    import uvicorn
+
+    workers = int(os.environ.get("WEB_CONCURRENCY", os.cpu_count() or 1))
+    # Workery počet zdědí a podle něj si dělí jádra pro paralelní dávky (BATCH_THREADS)
+    os.environ["WEB_CONCURRENCY"] = str(workers)
+
+    uvicorn.run(
+        "app:app",
+        host=os.environ.get("HOST", "0.0.0.0"),
+        port=int(os.environ.get("PORT", "8000")),
+        loop="uvloop",
+        http="httptools",
+        workers=workers,
+        access_log=False,
+    )
@@ -9,9 +9,17 @@ Finanční kalkulačka pro Emu + konzolové rozhraní.
     2) interaktivní zadávání z konzole
 """
 
+import math
 from dataclasses import dataclass
+from functools import lru_cache
 from enum import Enum
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Sequence
+
+import numpy as np
+from numba import set_num_threads
+
+import kalkulacka_kernels as kernels
 
 
 # ==========================
@@ -29,17 +37,17 @@ class InvestmentType(str, Enum):
     COMBINED = "combined"        # kombinace
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LumpSumInput:
     """Vstupy pro jednorázový cíl (např. 1 mil. za 20 let)."""
     target_amount: float              # cílová částka FV
     years: float                      # horizont v letech
     annual_rate_accum: float          # roční zhodnocení v akumulaci p_a1 (např. 0.07)
-    investment_type: InvestmentType   # typ investice
+    investment_type: str              # typ investice – hodnota InvestmentType
     one_time_investment: float = 0.0  # jednorázová investice dnes (pro kombinaci)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RentaInput:
     """Vstupy pro rentu / důchod."""
     monthly_rent: float               # požadovaná měsíční renta R
@@ -47,173 +55,384 @@ class RentaInput:
     annual_rate_rent: float           # roční zhodnocení v období čerpání p_a2
     years_saving: float               # doba akumulace v letech
     annual_rate_accum: float          # roční zhodnocení v akumulaci p_a1
-    investment_type: InvestmentType   # typ investice
+    investment_type: str              # typ investice – hodnota InvestmentType
     one_time_investment: float = 0.0  # jednorázová investice dnes (pro kombinaci)
 
 
-# ==========================
-# Základní matematika
-# ==========================
+class InputError(ValueError):
+    """Vstupy, pro které výpočet nedává smysl (např. nulový horizont pro měsíční vklady)."""
 
-def eff_monthly_rate(annual_rate: float) -> float:
-    """
-    Efektivní měsíční úroková sazba:
-    i = (1 + p_a)^(1/12) - 1
-    """
-    return (1.0 + annual_rate) ** (1.0 / 12.0) - 1.0
+
+# investment_type -> kód pro numerická jádra (kalkulacka_kernels)
+_KERNEL_INV_TYPE = {
+    InvestmentType.ONE_TIME.value: kernels.ONE_TIME,
+    InvestmentType.MONTHLY.value: kernels.MONTHLY,
+    InvestmentType.COMBINED.value: kernels.COMBINED,
+}
+
+_ZERO_HORIZON_MSG = "years must be at least one month for monthly/combined investment"
+
+# Nejdelší přípustný horizont v letech – počet měsíců pak bezpečně padne do int64 jader
+MAX_YEARS = 1000.0
+_YEARS_RANGE_MSG = f"must be a number between 0 and {MAX_YEARS:g}"
+_AMOUNT_MSG = "must be a finite number"
+_RATE_RANGE_MSG = "must be a finite rate greater than -1 (-100 %)"
+_RESULT_RANGE_MSG = "result is out of the floating point range for these inputs"
+
+# Predikáty vstupů fungují pro float i np.ndarray (po prvcích), aby skalární
+# výpočty i dávky (compute_lump_sum_vec) odmítaly přesně stejné hodnoty.
+# NaN neprojde žádným porovnáním, takže odpadne spolu s inf.
+
+
+def _years_ok(years):
+    """0 <= years <= MAX_YEARS"""
+    return (years >= 0.0) & (years <= MAX_YEARS)
 
 
-def fv_lump_sum(pv: float, i: float, n_months: int) -> float:
-    """Budoucí hodnota jednorázové investice."""
-    return pv * (1.0 + i) ** n_months
+def _amount_ok(amount):
+    """Konečná částka – NaN/inf by orjson zapsal jako null."""
+    return abs(amount) < math.inf
 
 
-def pv_from_fv(fv: float, i: float, n_months: int) -> float:
-    """Současná hodnota – kolik je potřeba investovat dnes."""
-    return fv / ((1.0 + i) ** n_months)
+def _rate_ok(rate):
+    """-1 < rate < inf – pro rate <= -1 je log1p(rate) v jádře NaN."""
+    return (rate > -1.0) & (rate < math.inf)
 
 
-def fv_annuity(monthly_payment: float, i: float, n_months: int) -> float:
-    """Budoucí hodnota měsíčních vkladů (anuita)."""
-    if i == 0:
-        return monthly_payment * n_months
-    return monthly_payment * ((1.0 + i) ** n_months - 1.0) / i
+def _check_years(name: str, years: float) -> None:
+    """NaN/inf/obří horizont by jádro převedlo na nesmyslný int64 počet měsíců."""
+    if not _years_ok(years):
+        raise InputError(f"{name} {_YEARS_RANGE_MSG}")
 
 
-def annuity_from_fv(fv: float, i: float, n_months: int) -> float:
-    """Reverzní výpočet – jaká měsíční investice vede na cílovou budoucí hodnotu."""
-    if i == 0:
-        return fv / n_months
-    return fv * i / ((1.0 + i) ** n_months - 1.0)
+def _check_amount(name: str, amount: float) -> None:
+    if not _amount_ok(amount):
+        raise InputError(f"{name} {_AMOUNT_MSG}")
 
 
+def _check_rate(name: str, rate: float) -> None:
+    if not _rate_ok(rate):
+        raise InputError(f"{name} {_RATE_RANGE_MSG}")
+
+
+def _check_result(result: Dict[str, Any]) -> None:
+    """I z konečných vstupů může vyjít inf/NaN (např. cíl 1e308 při vysoké sazbě)."""
+    if not all(_amount_ok(v) for v in result.values() if isinstance(v, float)):
+        raise InputError(_RESULT_RANGE_MSG)
+
+
+def _check_rows(ok: np.ndarray, message: str) -> None:
+    """Dávková obdoba _check_*: chyba vyjmenuje řádky, které neprošly."""
+    if not ok.all():
+        raise InputError(f"{message} (rows {np.flatnonzero(~ok).tolist()})")
+
+
+def _check_horizon(years: float, investment_type: str, name: str = "years") -> None:
+    """Horizont v rozsahu a měsíční vklady alespoň jeden měsíc (jinak dělení nulou v jádře)."""
+    _check_years(name, years)
+    if investment_type != InvestmentType.ONE_TIME.value and round(years * 12) == 0:
+        raise InputError(_ZERO_HORIZON_MSG)
+
+
+# ==========================
+# Základní matematika
+# ==========================
+# Vzorce jsou jen v kalkulacka_kernels (Numba), tady jsou obálky nad nimi.
+
+@lru_cache(maxsize=4096)
 def pv_renta_required(monthly_rent: float, annual_rate_rent: float, years_rent: float) -> float:
     """
     Potřebný majetek na začátku renty, aby šla čerpat měsíční renta R po daný počet let.
 
     PV_renta = R * (1 - (1 + i2)^(-n)) / i2
     kde i2 je efektivní měsíční sazba v období čerpání.
+
+    Počítá numerické jádro, výsledek se memoizuje – kalkulačka dostává
+    opakovaně stejné "kulaté" vstupy (např. 30 000 Kč / 30 let / 5 %).
     """
-    i2 = eff_monthly_rate(annual_rate_rent)
-    n = int(round(years_rent * 12))
-    if i2 == 0:
-        return monthly_rent * n
-    return monthly_rent * (1.0 - (1.0 + i2) ** (-n)) / i2
+    return kernels.pv_renta_required(monthly_rent, annual_rate_rent, years_rent)
 
 
 # ==========================
 # Výpočty pro jednorázový cíl
 # ==========================
 
-def compute_lump_sum(input_data: LumpSumInput) -> Dict[str, Any]:
+def _lump_one_time(input_data: LumpSumInput) -> Dict[str, Any]:
+    pv_needed, _, _, _ = kernels.lump_sum_kernel(
+        input_data.target_amount, input_data.years, input_data.annual_rate_accum, kernels.ONE_TIME, 0.0,
+    )
+    return {
+        "goal_type": "lump_sum",
+        "target_amount": input_data.target_amount,
+        "years": input_data.years,
+        "annual_rate_accum": input_data.annual_rate_accum,
+        "investment_type": input_data.investment_type,
+        "required_wealth_today": pv_needed,
+    }
+
+
+def _lump_monthly(input_data: LumpSumInput) -> Dict[str, Any]:
+    _, monthly, _, _ = kernels.lump_sum_kernel(
+        input_data.target_amount, input_data.years, input_data.annual_rate_accum, kernels.MONTHLY, 0.0,
+    )
+    return {
+        "goal_type": "lump_sum",
+        "target_amount": input_data.target_amount,
+        "years": input_data.years,
+        "annual_rate_accum": input_data.annual_rate_accum,
+        "investment_type": input_data.investment_type,
+        "monthly_investment": monthly,
+    }
+
+
+def _lump_combined(input_data: LumpSumInput) -> Dict[str, Any]:
+    _, monthly, fv_one_time, remaining = kernels.lump_sum_kernel(
+        input_data.target_amount, input_data.years, input_data.annual_rate_accum, kernels.COMBINED,
+        input_data.one_time_investment,
+    )
+    return {
+        "goal_type": "lump_sum",
+        "target_amount": input_data.target_amount,
+        "years": input_data.years,
+        "annual_rate_accum": input_data.annual_rate_accum,
+        "investment_type": input_data.investment_type,
+        "one_time_investment": input_data.one_time_investment,
+        "monthly_investment": monthly,
+        "fv_one_time_investment": fv_one_time,
+        "target_amount_remaining_for_monthly": remaining,
+    }
+
+
+# investment_type -> výpočet (místo řetězu if/elif nad InvestmentType)
+_LUMP_HANDLERS = {
+    InvestmentType.ONE_TIME.value: _lump_one_time,
+    InvestmentType.MONTHLY.value: _lump_monthly,
+    InvestmentType.COMBINED.value: _lump_combined,
+}
+
+
+@lru_cache(maxsize=8192)
+def compute_lump_sum(input_data: LumpSumInput) -> Mapping[str, Any]:
     """
     Spočítá plán pro jednorázový cíl.
+    Výsledek se memoizuje podle celého (frozen) vstupu, proto je vrácen
+    jako read-only MappingProxyType.
     Vrací slovník s klíči:
     - "target_amount"
     - "required_wealth_today" (ONE_TIME)
     - "monthly_investment" (MONTHLY / COMBINED)
     - "one_time_investment" (COMBINED)
     """
-    i = eff_monthly_rate(input_data.annual_rate_accum)
-    n = int(round(input_data.years * 12))
+    _check_amount("target_amount", input_data.target_amount)
+    _check_horizon(input_data.years, input_data.investment_type)
+    _check_rate("annual_rate_accum", input_data.annual_rate_accum)
+    _check_amount("one_time_investment", input_data.one_time_investment)
+    result = _LUMP_HANDLERS[input_data.investment_type](input_data)
+    _check_result(result)
+    return MappingProxyType(result)
+
+
+def compute_lump_sum_vec(
+    target: np.ndarray,
+    years: np.ndarray,
+    rate: np.ndarray,
+    one_time: np.ndarray,
+    inv_type: Sequence[str],
+) -> Dict[str, np.ndarray]:
+    """
+    Dávková varianta compute_lump_sum pro celé pole scénářů najednou
+    (stejné jádro jako compute_lump_sum, jen paralelně přes kernels.lump_sum_batch).
 
-    result: Dict[str, Any] = {
-        "goal_type": "lump_sum",
-        "target_amount": input_data.target_amount,
-        "years": input_data.years,
-        "annual_rate_accum": input_data.annual_rate_accum,
-        "investment_type": input_data.investment_type.value
+    inv_type je pole typů investice (hodnoty InvestmentType).
+    Vrací slovník polí se stejnými klíči jako compute_lump_sum; hodnoty,
+    které pro daný typ investice nedávají smysl, jsou 0.0.
+    """
+    target = np.ascontiguousarray(target, dtype=np.float64)
+    years = np.ascontiguousarray(years, dtype=np.float64)
+    rate = np.ascontiguousarray(rate, dtype=np.float64)
+    one_time = np.ascontiguousarray(one_time, dtype=np.float64)
+    try:
+        codes = np.array([_KERNEL_INV_TYPE[t] for t in inv_type], dtype=np.int64)
+    except KeyError as e:
+        raise InputError(f"Unknown investment_type: {e.args[0]}") from None
+
+    _check_rows(_amount_ok(target), f"target_amount {_AMOUNT_MSG}")
+    _check_rows(_years_ok(years), f"years {_YEARS_RANGE_MSG}")
+    _check_rows((np.rint(years * 12.0) != 0) | (codes == kernels.ONE_TIME), _ZERO_HORIZON_MSG)
+    _check_rows(_rate_ok(rate), f"annual_rate_accum {_RATE_RANGE_MSG}")
+    _check_rows(_amount_ok(one_time), f"one_time_investment {_AMOUNT_MSG}")
+
+    # set_num_threads platí jen pro aktuální vlákno (threadpool FastAPI jich má víc)
+    set_num_threads(kernels.BATCH_THREADS)
+    out = kernels.lump_sum_batch(target, years, rate, codes, one_time)
+    _check_rows(_amount_ok(out).all(axis=0), _RESULT_RANGE_MSG)
+    return {
+        "target_amount": target,
+        "years": years,
+        "annual_rate_accum": rate,
+        "required_wealth_today": out[0],
+        "monthly_investment": out[1],
+        "fv_one_time_investment": out[2],
+        "target_amount_remaining_for_monthly": out[3],
     }
 
-    if input_data.investment_type == InvestmentType.ONE_TIME:
-        pv_needed = pv_from_fv(input_data.target_amount, i, n)
-        result["required_wealth_today"] = pv_needed
 
-    elif input_data.investment_type == InvestmentType.MONTHLY:
-        monthly = annuity_from_fv(input_data.target_amount, i, n)
-        result["monthly_investment"] = monthly
+# Parametry LumpSumInput, přes které jde udělat citlivostní analýzu
+SWEEP_PARAMS = ("target_amount", "years", "annual_rate_accum", "one_time_investment")
 
-    elif input_data.investment_type == InvestmentType.COMBINED:
-        fv_one_time = fv_lump_sum(input_data.one_time_investment, i, n)
-        remaining = input_data.target_amount - fv_one_time
-        if remaining < 0:
-            remaining = 0.0
-        monthly = annuity_from_fv(remaining, i, n)
-        result["one_time_investment"] = input_data.one_time_investment
-        result["monthly_investment"] = monthly
-        result["fv_one_time_investment"] = fv_one_time
-        result["target_amount_remaining_for_monthly"] = remaining
 
-    return result
+def compute_lump_sum_sweep(input_data: LumpSumInput, param: str, values: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Citlivostní analýza jednorázového cíle – spočítá plán pro každou hodnotu
+    parametru param (jeden z SWEEP_PARAMS), ostatní vstupy zůstávají z input_data.
+
+    Vrací slovník polí se stejnými výslednými klíči jako compute_lump_sum.
+    """
+    if param not in SWEEP_PARAMS:
+        raise InputError(f"Unknown sweep param: {param}")
+
+    size = len(values)
+    columns = {name: np.full(size, getattr(input_data, name), dtype=np.float64) for name in SWEEP_PARAMS}
+    columns[param] = values
+
+    res = compute_lump_sum_vec(
+        target=columns["target_amount"],
+        years=columns["years"],
+        rate=columns["annual_rate_accum"],
+        one_time=columns["one_time_investment"],
+        inv_type=[input_data.investment_type] * size,
+    )
+
+    if input_data.investment_type == InvestmentType.ONE_TIME.value:
+        keys = ("required_wealth_today",)
+    elif input_data.investment_type == InvestmentType.MONTHLY.value:
+        keys = ("monthly_investment",)
+    else:
+        keys = ("monthly_investment", "fv_one_time_investment", "target_amount_remaining_for_monthly")
+    return {key: res[key] for key in keys}
 
 
 # ==========================
 # Výpočty pro rentu
 # ==========================
 
-def compute_renta(input_data: RentaInput) -> Dict[str, Any]:
-    """
-    Spočítá plán pro rentu.
+def _renta_one_time(input_data: RentaInput, required_wealth_at_rent_start: float) -> Dict[str, Any]:
+    pv_today, _, _, _ = kernels.lump_sum_kernel(
+        required_wealth_at_rent_start, input_data.years_saving, input_data.annual_rate_accum, kernels.ONE_TIME, 0.0,
+    )
+    return {
+        "goal_type": "renta",
+        "monthly_rent": input_data.monthly_rent,
+        "years_rent": input_data.years_rent,
+        "annual_rate_rent": input_data.annual_rate_rent,
+        "years_saving": input_data.years_saving,
+        "annual_rate_accum": input_data.annual_rate_accum,
+        "investment_type": input_data.investment_type,
+        "required_wealth_at_rent_start": required_wealth_at_rent_start,
+        "required_wealth_today": pv_today,
+    }
 
-    Krok 1: zjistíme potřebný majetek na začátku renty (PV_renta).
-    Krok 2: zjistíme, jak tento majetek nainvestovat (jednorázově, měsíčně, kombinovaně).
-    """
-    required_wealth_at_rent_start = pv_renta_required(
-        monthly_rent=input_data.monthly_rent,
-        annual_rate_rent=input_data.annual_rate_rent,
-        years_rent=input_data.years_rent,
+
+def _renta_monthly(input_data: RentaInput, required_wealth_at_rent_start: float) -> Dict[str, Any]:
+    _, monthly, _, _ = kernels.lump_sum_kernel(
+        required_wealth_at_rent_start, input_data.years_saving, input_data.annual_rate_accum, kernels.MONTHLY, 0.0,
     )
+    return {
+        "goal_type": "renta",
+        "monthly_rent": input_data.monthly_rent,
+        "years_rent": input_data.years_rent,
+        "annual_rate_rent": input_data.annual_rate_rent,
+        "years_saving": input_data.years_saving,
+        "annual_rate_accum": input_data.annual_rate_accum,
+        "investment_type": input_data.investment_type,
+        "required_wealth_at_rent_start": required_wealth_at_rent_start,
+        "monthly_investment": monthly,
+    }
 
-    i1 = eff_monthly_rate(input_data.annual_rate_accum)
-    m = int(round(input_data.years_saving * 12))
 
-    result: Dict[str, Any] = {
+def _renta_combined(input_data: RentaInput, required_wealth_at_rent_start: float) -> Dict[str, Any]:
+    _, monthly, fv_one_time, remaining = kernels.lump_sum_kernel(
+        required_wealth_at_rent_start, input_data.years_saving, input_data.annual_rate_accum, kernels.COMBINED,
+        input_data.one_time_investment,
+    )
+    return {
         "goal_type": "renta",
         "monthly_rent": input_data.monthly_rent,
         "years_rent": input_data.years_rent,
         "annual_rate_rent": input_data.annual_rate_rent,
         "years_saving": input_data.years_saving,
         "annual_rate_accum": input_data.annual_rate_accum,
-        "investment_type": input_data.investment_type.value,
+        "investment_type": input_data.investment_type,
         "required_wealth_at_rent_start": required_wealth_at_rent_start,
+        "one_time_investment": input_data.one_time_investment,
+        "monthly_investment": monthly,
+        "fv_one_time_investment": fv_one_time,
+        "target_amount_remaining_for_monthly": remaining,
     }
 
-    if input_data.investment_type == InvestmentType.ONE_TIME:
-        pv_today = pv_from_fv(required_wealth_at_rent_start, i1, m)
-        result["required_wealth_today"] = pv_today
 
-    elif input_data.investment_type == InvestmentType.MONTHLY:
-        monthly = annuity_from_fv(required_wealth_at_rent_start, i1, m)
-        result["monthly_investment"] = monthly
+_RENTA_HANDLERS = {
+    InvestmentType.ONE_TIME.value: _renta_one_time,
+    InvestmentType.MONTHLY.value: _renta_monthly,
+    InvestmentType.COMBINED.value: _renta_combined,
+}
 
-    elif input_data.investment_type == InvestmentType.COMBINED:
-        fv_one_time = fv_lump_sum(input_data.one_time_investment, i1, m)
-        remaining = required_wealth_at_rent_start - fv_one_time
-        if remaining < 0:
-            remaining = 0.0
-        monthly = annuity_from_fv(remaining, i1, m)
-        result["one_time_investment"] = input_data.one_time_investment
-        result["monthly_investment"] = monthly
-        result["fv_one_time_investment"] = fv_one_time
-        result["target_amount_remaining_for_monthly"] = remaining
 
-    return result
+@lru_cache(maxsize=8192)
+def compute_renta(input_data: RentaInput) -> Mapping[str, Any]:
+    """
+    Spočítá plán pro rentu.
+    Stejně jako compute_lump_sum memoizuje výsledek a vrací ho read-only.
+
+    Krok 1: zjistíme potřebný majetek na začátku renty (PV_renta).
+    Krok 2: zjistíme, jak tento majetek nainvestovat (jednorázově, měsíčně, kombinovaně)
+            – to je stejný výpočet jako u jednorázového cíle s cílem PV_renta.
+    """
+    _check_amount("monthly_rent", input_data.monthly_rent)
+    _check_years("years_rent", input_data.years_rent)
+    _check_rate("annual_rate_rent", input_data.annual_rate_rent)
+    _check_horizon(input_data.years_saving, input_data.investment_type, "years_saving")
+    _check_rate("annual_rate_accum", input_data.annual_rate_accum)
+    _check_amount("one_time_investment", input_data.one_time_investment)
+    required_wealth_at_rent_start = pv_renta_required(
+        input_data.monthly_rent,
+        input_data.annual_rate_rent,
+        input_data.years_rent,
+    )
+    result = _RENTA_HANDLERS[input_data.investment_type](input_data, required_wealth_at_rent_start)
+    _check_result(result)
+    return MappingProxyType(result)
+
+
+def clear_caches() -> None:
+    """Vyprázdní všechny memoizační cache výpočtů."""
+    compute_lump_sum.cache_clear()
+    compute_renta.cache_clear()
+    pv_renta_required.cache_clear()
 
 
 # ==========================
 # Pomocné funkce pro výpis a input
 # ==========================
 
+_SPACE_TBL = str.maketrans("_", " ")
+
+
 def pretty(num: float) -> str:
     """Hezké zaokrouhlení na celé Kč pro výpis."""
-    return f"{num:,.0f}".replace(",", " ")
+    return format(num, "_.0f").translate(_SPACE_TBL)
+
+
+# Čištění vstupu jedním průchodem: mezery pryč, čárka -> tečka
+_NUMBER_TBL = str.maketrans({",": ".", " ": ""})
 
 
 def ask_float(prompt: str) -> float:
     """Bezpečné načtení čísla z konzole. Umí tečku i čárku."""
     while True:
         raw = input(prompt + " ")
-        raw = raw.strip().replace(" ", "").replace(",", ".")
+        # okrajové bílé znaky (např. \n) zvládne float() sám
+        raw = raw.translate(_NUMBER_TBL)
         try:
             return float(raw)
         except ValueError:
@@ -269,7 +488,7 @@ def interactive_lump_sum():
         target_amount=target,
         years=years,
         annual_rate_accum=rate,
-        investment_type=inv_type,
+        investment_type=inv_type.value,
         one_time_investment=one_time,
     )
     res = compute_lump_sum(data)
@@ -325,7 +544,7 @@ def interactive_renta():
         annual_rate_rent=rate_rent,
         years_saving=years_saving,
         annual_rate_accum=rate_accum,
-        investment_type=inv_type,
+        investment_type=inv_type.value,
         one_time_investment=one_time,
     )
     res = compute_renta(data)
@@ -373,7 +592,7 @@ def run_manual_tests():
         target_amount=1_000_000,
         years=20,
         annual_rate_accum=0.07,
-        investment_type=InvestmentType.MONTHLY,
+        investment_type=InvestmentType.MONTHLY.value,
     )
     res1 = compute_lump_sum(lump)
     print("Očekávám měsíční investici cca 1 970 Kč")
@@ -384,7 +603,7 @@ def run_manual_tests():
         target_amount=5_000_000,
         years=18,
         annual_rate_accum=0.07,
-        investment_type=InvestmentType.MONTHLY,
+        investment_type=InvestmentType.MONTHLY.value,
     )
     res2 = compute_lump_sum(lump2)
     print("Očekávám měsíční investici cca 11 879 Kč")
@@ -397,7 +616,7 @@ def run_manual_tests():
         annual_rate_rent=0.05,
         years_saving=18,            # pro ukázku i akumulace
         annual_rate_accum=0.07,
-        investment_type=InvestmentType.MONTHLY,
+        investment_type=InvestmentType.MONTHLY.value,
     )
     res3 = compute_renta(renta1)
     print("Očekávám potřebný majetek cca 5 659 788 Kč")
@@ -411,7 +630,7 @@ def run_manual_tests():
         annual_rate_rent=0.05,
         years_saving=18,
         annual_rate_accum=0.08,
-        investment_type=InvestmentType.MONTHLY,
+        investment_type=InvestmentType.MONTHLY.value,
     )
     res4 = compute_renta(renta2)
     print("Očekávám měsíční investici cca 7 241 Kč")
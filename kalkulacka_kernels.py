@@ -0,0 +1,136 @@
+"""
+kalkulacka_kernels.py
+Numerická jádra kalkulačky zkompilovaná přes Numba.
+
+- čistě skalární výpočty bez Python objektů (float/int in, float/tuple out)
+- explicitní signatury => kompilace proběhne už při importu, ne při prvním requestu
+- cache=True => zkompilovaný kód se ukládá do __pycache__ a při dalším startu
+  serveru se jen načte
+- dávkové smyčky (lump_sum_batch) běží paralelně přes prange
+"""
+
+import math
+import os
+
+import numpy as np
+from numba import config, float64, int64, njit, prange
+from numba.types import UniTuple
+
+
+# Paralelní jádra volá FastAPI z více vláken threadpoolu současně. Výchozí vrstva
+# "workqueue" souběžné paralelní oblasti nesnese a proces skončí SIGABRT,
+# "threadsafe" vybere tbb (v requirements) nebo omp. Musí být nastaveno před
+# prvním spuštěním paralelního jádra.
+config.THREADING_LAYER = "threadsafe"
+
+# Vlákna na jednu dávku: uvicorn pouští worker na každé jádro (WEB_CONCURRENCY),
+# takže si každý worker bere jen svůj díl jader, ne všechna. Numba nastavuje
+# počet vláken per vlákno volajícího – viz compute_lump_sum_vec.
+_DEFAULT_BATCH_THREADS = config.NUMBA_NUM_THREADS // int(os.environ.get("WEB_CONCURRENCY", "1"))
+BATCH_THREADS = min(
+    config.NUMBA_NUM_THREADS,
+    max(1, int(os.environ.get("BATCH_THREADS", _DEFAULT_BATCH_THREADS))),
+)
+
+# Kódy typů investice (InvestmentType -> int pro jádra)
+ONE_TIME = 0
+MONTHLY = 1
+COMBINED = 2
+
+# Pod touto měsíční sazbou se anuita počítá jako nulová sazba (bez dělení ~0)
+ZERO_RATE_EPS = 1e-12
+
+
+@njit(float64(float64), cache=True)
+def eff_monthly_rate(annual_rate):
+    """i = (1 + p_a)^(1/12) - 1"""
+    return math.expm1(math.log1p(annual_rate) * (1.0 / 12.0))
+
+
+@njit(float64(float64, int64), cache=True)
+def ipow(base, exp):
+    """Celočíselná mocnina base^exp metodou square-and-multiply."""
+    result = 1.0
+    if exp < 0:
+        # -(exp + 1) místo -exp: -INT64_MIN přeteče zpět na záporné číslo a smyčka by nekončila
+        base = 1.0 / base
+        result = base
+        exp = -(exp + 1)
+    while exp:
+        if exp & 1:
+            result *= base
+        base *= base
+        exp >>= 1
+    return result
+
+
+@njit(int64(float64), cache=True)
+def months(years):
+    """Počet měsíců – zaokrouhlení stejné jako Pythonní int(round(years * 12))."""
+    return int64(round(years * 12.0))
+
+
+@njit(float64(float64, float64, float64), cache=True)
+def pv_renta_required(monthly_rent, annual_rate_rent, years_rent):
+    """PV_renta = R * (1 - (1 + i2)^(-n)) / i2"""
+    i2 = eff_monthly_rate(annual_rate_rent)
+    n = months(years_rent)
+    if abs(i2) < ZERO_RATE_EPS:
+        return monthly_rent * n
+    # 1 - (1 + i2)^(-n) přes expm1 – bez katastrofického odčítání pro i2 blízko 0
+    return monthly_rent * -math.expm1(-n * math.log1p(i2)) / i2
+
+
+@njit(UniTuple(float64, 4)(float64, float64, float64, int64, float64), cache=True)
+def lump_sum_kernel(target, years, annual_rate, inv_type, one_time):
+    """
+    Plán, jak dosáhnout cílové částky target za years let.
+
+    Vrací (required_wealth_today, monthly_investment,
+           fv_one_time_investment, target_amount_remaining_for_monthly);
+    hodnoty, které pro daný typ investice nedávají smysl, jsou 0.0.
+
+    Všechny typy sdílí jediný faktor c = (1 + i)^n, kombinace je uzavřený vzorec
+    monthly = max(0, target - one_time * c) * i / (c - 1);
+    měsíční investice je target * i / (c - 1) bez ořezu na nulu.
+    """
+    i = eff_monthly_rate(annual_rate)
+    n = months(years)
+    c = ipow(1.0 + i, n)
+
+    if inv_type == ONE_TIME:
+        return target / c, 0.0, 0.0, 0.0
+
+    if inv_type == MONTHLY:
+        fv_one_time = 0.0
+        remaining = target
+    else:
+        fv_one_time = one_time * c
+        remaining = target - fv_one_time
+        if remaining < 0:
+            remaining = 0.0
+
+    if abs(i) < ZERO_RATE_EPS:
+        monthly = remaining / n
+    else:
+        # (c - 1) přes expm1 – bez katastrofického odčítání pro i blízko 0
+        monthly = remaining * i / math.expm1(n * math.log1p(i))
+    return 0.0, monthly, fv_one_time, remaining
+
+
+@njit(float64[:, ::1](float64[::1], float64[::1], float64[::1], int64[::1], float64[::1]), parallel=True, cache=True)
+def lump_sum_batch(targets, years, annual_rates, inv_types, one_times):
+    """
+    lump_sum_kernel přes celé pole scénářů (dávky, citlivostní analýza), paralelně přes prange.
+
+    Vrací pole tvaru (4, N) – řádky ve stejném pořadí jako výstup lump_sum_kernel.
+    """
+    size = targets.size
+    out = np.empty((4, size))
+    for k in prange(size):
+        res = lump_sum_kernel(targets[k], years[k], annual_rates[k], inv_types[k], one_times[k])
+        out[0, k] = res[0]
+        out[1, k] = res[1]
+        out[2, k] = res[2]
+        out[3, k] = res[3]
+    return out